@@ -0,0 +1,234 @@
+import asyncio
+import os
+import time
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+
+from .core import (
+    CongressAuthError,
+    CongressHTTPError,
+    _encode_query,
+    _ENDPOINTS,
+    _loads,
+    _validate_params,
+)
+
+
+class AsyncCongress():
+    """Asynchronous Python wrapper class implementing a client for Congress.gov API,
+    built on aiohttp so many requests can be in flight concurrently.
+    For documentation, see:
+    https://api.congress.gov/#/bill
+    https://github.com/LibraryOfCongress/api.congress.gov/
+
+    Intended to be used as an async context manager:
+
+        async with AsyncCongress(api_key=my_api_key) as client:
+            text = await client.bill()
+
+    Returns:
+        AsyncCongress: object
+    """
+
+    # Token bucket shared across instances, pacing requests to the API's
+    # published limit of 1000 requests per hour
+    _limiter = AsyncLimiter(max_rate=1000, time_period=3600)
+
+    __origin_url = "https://api.congress.gov/v3"
+    token_param_name = "api_key"
+
+    def __init__(self, api_key=None):
+
+        # Get API Key
+        self.__api_key = api_key or os.environ.get("CONGRESS_API_KEY")
+        if not self.__api_key:
+            raise CongressAuthError(
+                "Congress API Key not found; set CONGRESS_API_KEY or pass api_key="
+            )
+
+        # Session is built lazily in __aenter__ so __init__ stays usable
+        # outside a running event loop
+        self._session = None
+
+        # Memoize in-flight and completed requests briefly; storing futures
+        # means concurrent duplicate calls await one shared request
+        self._cache = TTLCache(maxsize=1024, ttl=900)
+
+        # Precompute the base URL of each endpoint family so composing a
+        # request URL is a dict lookup plus one concatenation
+        self._endpoint_urls = {
+            url: f"{self.__origin_url}/{url}" for url in _ENDPOINTS.values()
+        }
+
+    async def __aenter__(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=128, limit_per_host=64),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"Accept": "application/json"},
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying aiohttp session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send_request(self, full_url, **kwargs):
+        """Send a get request to the specified congress API endpoint, with the provided parameters.
+
+        Args:
+            full_url (str): Congress API endpoint
+
+        Raises:
+            CongressHTTPError: If get request is unsuccessful
+
+        Returns:
+            str: Contents of response text
+        """
+
+        kwargs[self.token_param_name] = self.__api_key
+        # Encode the query once in canonical (sorted) order; identical calls
+        # reuse the cached string
+        full_url = f"{full_url}?{_encode_query(tuple(sorted(kwargs.items())))}"
+        async with self._limiter:
+            async with self._session.get(full_url) as response:
+                if response.status != 200:
+                    raise CongressHTTPError(
+                        f"Bad request; API responded with status code {response.status}",
+                        status_code=response.status,
+                        response=response,
+                    )
+                body = await response.text()
+
+                # If the server says the hourly quota is exhausted, sleep until
+                # it resets before letting further requests through
+                remaining = response.headers.get("X-RateLimit-Remaining")
+                reset = response.headers.get("X-RateLimit-Reset")
+                if remaining == "0" and reset is not None:
+                    delay = float(reset) - time.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                return body
+
+    def __compose_full_url(self, url_prefix, path):
+        """Compose full URL to be propagated to _send_request()
+
+        Args:
+            url_prefix (str): Root of desired Congress API endpoint
+            path (str): Path of desired Congress API endpoint, not including the root
+
+        Returns:
+            str: Full path of desired Congress API endpoint (i.e including the root)
+        """
+
+        if path:
+            return self._endpoint_urls[url_prefix] + "/" + path.lower()
+        return self._endpoint_urls[url_prefix]
+
+    async def _process_request(self, url_prefix, path, params):
+        """Processes requests to the Congress API. First validates the user-specified
+        parameters, then composes a full URL of the endpoint, and finally sends the request to
+        (and receives the response from) the Congress API.
+
+        Args:
+            url_prefix (str): Root of desired Congress API endpoint
+            path (str): Path of desired Congress API endpoint, not including the root
+            params (dict): User-specified parameter names and values to be propagated to
+            _send_request()
+
+        Returns:
+            str: Contents of response text
+        """
+
+        query_params = _validate_params(params)
+
+        key = (url_prefix, path, tuple(sorted(query_params.items())))
+        future = self._cache.get(key)
+        if future is None:
+            full_url = self.__compose_full_url(url_prefix, path)
+            future = asyncio.ensure_future(self._send_request(full_url, **query_params))
+            self._cache[key] = future
+
+        try:
+            return await future
+        except Exception:
+            # Don't serve failures from the cache
+            self._cache.pop(key, None)
+            raise
+
+    async def gather_pages(self, endpoint, total, path=None, page_size=250,
+                           max_concurrency=16, **params):
+        """Fetch a paginated endpoint concurrently. Fires one request per page offset
+        through a semaphore that bounds how many are in flight, so an N-page fetch takes
+        roughly N/max_concurrency round trips while the shared rate limiter still
+        enforces the hourly budget.
+
+        Args:
+            endpoint (str): Endpoint method name, e.g. 'bill' or 'committee_report'
+            total (int): Total number of records to fetch
+            path (str, optional): Endpoint URL, not including the root. Defaults to None.
+            page_size (int, optional): Records per request; 250 is the API maximum.
+            Defaults to 250.
+            max_concurrency (int, optional): Maximum requests in flight. Defaults to 16.
+
+        Returns:
+            list: Contents of response text for each page, in offset order
+        """
+
+        if endpoint not in _ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{endpoint}' supplied.")
+        url_prefix = _ENDPOINTS[endpoint]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_page(offset):
+            async with semaphore:
+                page_params = {**params, "offset": offset, "limit": page_size}
+                return await self._process_request(url_prefix, path, page_params)
+
+        return await asyncio.gather(
+            *(fetch_page(offset) for offset in range(0, total, page_size))
+        )
+
+
+def _make_endpoint(py_name, url_prefix):
+    """Build an async endpoint method implementing access to one endpoint family.
+
+    Args:
+        py_name (str): Method name as exposed on AsyncCongress
+        url_prefix (str): Root of the desired Congress API endpoint family
+
+    Returns:
+        function: Coroutine method implementing the endpoint
+    """
+
+    async def endpoint(self, path=None, parse=False, **params):
+        body = await self._process_request(url_prefix, path, params)
+        if parse:
+            return _loads(body)
+        return body
+
+    endpoint.__name__ = py_name
+    endpoint.__qualname__ = f"AsyncCongress.{py_name}"
+    endpoint.__doc__ = f"""Implements access to all '/{url_prefix}/...' endpoints \
+of the Congress API
+
+        Args:
+            path (str, optional): Endpoint URL, not including the root. Defaults to None.
+            parse (bool, optional): If True, return the response body decoded from JSON
+            instead of the raw text. Defaults to False.
+
+        Returns:
+            str: Contents of response text, or the decoded JSON object when parse=True
+        """
+    return endpoint
+
+
+for _py_name, _url_prefix in _ENDPOINTS.items():
+    setattr(AsyncCongress, _py_name, _make_endpoint(_py_name, _url_prefix))
@@ -1,9 +1,178 @@
 import os
-from time import sleep
+import threading
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
+from time import monotonic, sleep, time
+from types import MappingProxyType
+from urllib.parse import urlencode
 from warnings import warn
 
 import requests
+import urllib3
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 support is optional
+    httpx = None
+
+try:
+    # orjson parses bytes directly and is several times faster than stdlib json
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+
+class CongressAuthError(RuntimeError):
+    """Raised when no API key is supplied or found in the environment."""
+
+
+class CongressHTTPError(ValueError):
+    """Raised when the Congress API responds with a non-200 status code.
+
+    Carries the offending status code and response so callers can branch
+    without re-parsing the message.
+    """
+
+    def __init__(self, message, status_code=None, response=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = response
+
+
+# Endpoint families exposed as methods, mapping method name to URL prefix
+_ENDPOINTS = {
+    "bill": "bill",
+    "amendment": "amendment",
+    "summaries": "summaries",
+    "congress": "congress",
+    "member": "member",
+    "committee": "committee",
+    "committee_report": "committee-report",
+    "committee_print": "committee-print",
+    "committee_meeting": "committee-meeting",
+    "hearing": "hearing",
+    "congressional_record": "congressional-record",
+    "daily_congressional_record": "daily-congressional-record",
+    "bound_congressional_record": "bound-congressional-record",
+    "house_communication": "house-communication",
+    "house_requirement": "house-requirement",
+    "senate_communication": "senate-communication",
+    "nomination": "nomination",
+    "treaty": "treaty",
+}
+
+CURRENT_DATE_OFFSET = timedelta(days=365*20)  # API searches roughly 20 years from today
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Read-only defaults applied to every request; the date-window defaults are
+# computed per call in _validate_params so they stay current
+_DEFAULT_QUERY_PARAMS = MappingProxyType({
+    "format": "json",
+    "offset": 0,
+    "limit": 25,
+    "sort": "updateDate+desc",
+})
+_DATE_PARAMS = ("fromDateTime", "toDateTime")
+_ALLOWED_PARAMS = frozenset(_DEFAULT_QUERY_PARAMS) | frozenset(_DATE_PARAMS)
+
+
+@lru_cache(maxsize=256)
+def _encode_query(items):
+    """Encode a canonical (sorted) tuple of query parameters, memoized so
+    repeated identical queries (pagination, polling) reuse one encoded string.
+
+    Args:
+        items (tuple): Sorted (name, value) pairs
+
+    Returns:
+        str: The urlencoded query string
+    """
+
+    return urlencode(items)
+
+
+def _make_retry():
+    """Build the shared retry policy: jittered exponential backoff on 429/5xx GETs,
+    honoring a server-supplied Retry-After header. Requires urllib3 >= 2.0.
+
+    Returns:
+        urllib3.util.Retry: The retry policy
+    """
+
+    return Retry(
+        total=5,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        # Hand back the final response once retries are exhausted, so
+        # __send_request raises CongressHTTPError instead of urllib3 raising
+        # MaxRetryError/RetryError
+        raise_on_status=False,
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_window(hour_bucket):
+    """Compute the default fromDateTime/toDateTime strings, refreshed hourly.
+
+    Args:
+        hour_bucket (int): Current hour since the epoch; serves as the cache key
+        so the window is only reformatted once per hour
+
+    Returns:
+        tuple: fromDateTime and toDateTime strings in DATETIME_FORMAT
+    """
+
+    now = datetime.now()
+    return (
+        (now - CURRENT_DATE_OFFSET).strftime(DATETIME_FORMAT),
+        now.strftime(DATETIME_FORMAT),
+    )
+
+
+def _validate_params(params):
+    """Validate get request parameter values
+
+    Args:
+        params (dict): User-specified parameter names and values to be propagated to
+        the get request
+
+    Returns:
+        query_params (dict): Validated parameter names and values to be propagated to
+        the get request
+    """
+
+    # Find unknown names with one C-level set difference and warn once per
+    # call instead of once per bad key
+    unknown = params.keys() - _ALLOWED_PARAMS
+    if unknown:
+        warn(
+            f"Invalid parameter name(s) {sorted(unknown)} supplied."
+            " Will use default names and values instead.",
+            stacklevel=3,
+        )
+
+    # Start from a fresh copy of the defaults so user overrides never leak
+    # into subsequent calls
+    query_params = dict(_DEFAULT_QUERY_PARAMS)
+    query_params.update(
+        (param, value) for param, value in params.items() if param not in unknown
+    )
+
+    # Fill in the default search window only when the user didn't supply one
+    if "fromDateTime" not in query_params or "toDateTime" not in query_params:
+        from_default, to_default = _default_window(int(time()) // 3600)
+        query_params.setdefault("fromDateTime", from_default)
+        query_params.setdefault("toDateTime", to_default)
+    return query_params
 
 
 class Congress():
@@ -16,117 +185,157 @@ class Congress():
         Congress: object
     """
 
-    FIRST_REQUEST_TIMESTAMP = None
-    CURRENT_DATE_OFFSET = timedelta(days=365*20)  # API searches roughly 20 years from today
-    DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
-    REQUEST_COUNT = 0
+    RATE_LIMIT = 1000  # Maximum requests allowed per window
+    RATE_LIMIT_WINDOW = 3600  # Window length in seconds
 
     __origin_url = "https://api.congress.gov/v3"
     token_param_name = "api_key"
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, http2=False, fast=False):
 
         # Get API Key
-        if api_key:
-            self.__api_key = api_key
+        self.__api_key = api_key or os.environ.get("CONGRESS_API_KEY")
+        if not self.__api_key:
+            raise CongressAuthError(
+                "Congress API Key not found; set CONGRESS_API_KEY or pass api_key="
+            )
+
+        if http2 and fast:
+            raise ValueError("http2 and fast modes are mutually exclusive")
+
+        self._session = None
+        self._pool = None
+        if fast:
+            # Talk to urllib3 directly, skipping requests' prepared-request
+            # pipeline (hook dispatch, cookie jar merge) for bulk workloads;
+            # the API key travels as the X-Api-Key header
+            self._pool = urllib3.PoolManager(
+                maxsize=32,
+                headers={"X-Api-Key": self.__api_key, "Accept": "application/json"},
+                retries=_make_retry(),
+            )
+        elif http2:
+            # Multiplex all requests over a single HTTP/2 connection, so
+            # parallel calls don't serialize behind one another. Requires the
+            # 'httpx[http2]' package.
+            if httpx is None:
+                raise ImportError("HTTP/2 support requires the 'httpx[http2]' package")
+            self._session = httpx.Client(
+                http2=True,
+                headers={"Accept": "application/json"},
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
         else:
-            try:
-                self.__api_key = os.environ["CONGRESS_API_KEY"]
-            except KeyError:
-                print("Congress API Key not found")
-                raise
-
-        # Initialize default query parameters
-        self.__default_query_params = {
-            "format": "json",
-            "offset": 0,
-            "limit": 25,
-            "fromDateTime": (
-                datetime.now() - self.CURRENT_DATE_OFFSET
-            ).strftime(self.DATETIME_FORMAT),
-            "toDateTime": datetime.now().strftime(self.DATETIME_FORMAT),
-            "sort": "updateDate+desc",
+            # Pooled HTTP/1.1 session so repeat requests reuse one TCP/TLS
+            # connection, with retries on transient failures handled by urllib3
+            self._session = requests.Session()
+            self._session.headers.update({"Accept": "application/json"})
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=32,
+                # Jittered backoff so retrying clients don't synchronize and
+                # re-trigger 429s
+                max_retries=_make_retry(),
+            )
+            self._session.mount("https://", adapter)
+        self._http2 = http2
+
+        # Sliding window of recent request timestamps for throttling; kept
+        # per instance so clients with different keys don't share one budget,
+        # and guarded by a lock so threaded callers don't race the deque
+        self._request_times = deque()
+        self._throttle_lock = threading.Lock()
+
+        # Memoize responses briefly; Congress data is largely static within a
+        # session, so repeat calls collapse to a dict lookup. cachetools is
+        # not thread-safe, so access goes through its own lock
+        self._cache = TTLCache(maxsize=1024, ttl=900)
+        self._cache_lock = threading.Lock()
+
+        # Precompute the base URL of each endpoint family so composing a
+        # request URL is a dict lookup plus one concatenation
+        self._endpoint_urls = {
+            url: f"{self.__origin_url}/{url}" for url in _ENDPOINTS.values()
         }
 
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+        if self._pool is not None:
+            self._pool.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __throttle(self):
-        rq_pace_limit = 1000/3600  # Rate limit (1000 requests per hour) in rq/seconds
-        time_delta_secs = (datetime.now() - Congress.FIRST_REQUEST_TIMESTAMP)
-        request_pace = Congress.REQUEST_COUNT / time_delta_secs.total_seconds()
+        with self._throttle_lock:
+            now = monotonic()
+            # Drop timestamps that have aged out of the window
+            while self._request_times and now - self._request_times[0] >= self.RATE_LIMIT_WINDOW:
+                self._request_times.popleft()
+
+            if len(self._request_times) >= self.RATE_LIMIT:
+                # Wait until the oldest request in the window expires
+                delay = self.RATE_LIMIT_WINDOW - (now - self._request_times[0])
+            else:
+                delay = 0
 
-        if request_pace >= rq_pace_limit:
+        if delay > 0:
             print("Throttling...")
-            # print(f"Current pace of requests ({request_pace * 3600} per hour) too high. Throttling...")  # noqa: E501
-            # Calculate delay
-            delay = timedelta(
-                seconds=((Congress.REQUEST_COUNT + 1)/rq_pace_limit)
-            ) - time_delta_secs
-            delay = delay.total_seconds()  # convert to seconds
-        else:
-            delay = 0
-
-        sleep(delay)
+            sleep(delay)
 
-    def __send_request(self, full_url, throttle, **kwargs):
+    def __send_request(self, full_url, throttle, stream=False, **kwargs):
         """Send a get request to the specified congress API endpoint, with the provided parameters.
 
         Args:
             full_url (str): Congress API endpoint
+            stream (bool): If True, don't read the response body up front; the caller
+            consumes it incrementally and releases the response (iter_content/close on
+            requests.Response, stream()/release_conn on urllib3.HTTPResponse)
 
         Raises:
-            ValueError: If get request is unsuccessful
+            CongressHTTPError: If get request is unsuccessful
 
         Returns:
             response (requests.Response): The response object
         """
-        # Store time of first request persistently for throttling
-        if Congress.FIRST_REQUEST_TIMESTAMP is None:
-            Congress.FIRST_REQUEST_TIMESTAMP = datetime.now()
-
-        if Congress.REQUEST_COUNT > 1:
-            if throttle:
-                self.__throttle()
-
-        kwargs[self.token_param_name] = self.__api_key
-        response = requests.get(full_url, params=kwargs)
-        Congress.REQUEST_COUNT += 1
-
-        # Try again 3 times if request is unsuccessful
-        while_count = 0
-        while (response.status_code != 200) and (while_count < 3):
-            sleep(0.5)  # rest for a bit
-            response = requests.get(full_url, params=kwargs)
-            Congress.REQUEST_COUNT += 1
-            while_count += 1
-
-        if response.status_code != 200:
-            raise ValueError(f"Bad request; API responded with status code {response.status_code}")
+        if throttle:
+            self.__throttle()
+
+        # Encode the query once in canonical (sorted) order; identical calls
+        # reuse the cached string. The api_key rides in the query for the
+        # session transports; fast mode sends it as the X-Api-Key header
+        if self._pool is None:
+            kwargs[self.token_param_name] = self.__api_key
+        full_url = f"{full_url}?{_encode_query(tuple(sorted(kwargs.items())))}"
+
+        # Retries on failure are handled by the pool/adapter retry policy
+        if self._pool is not None:
+            response = self._pool.request("GET", full_url, preload_content=not stream)
+            status_code = response.status
+        elif stream:
+            response = self._session.get(full_url, stream=True)
+            status_code = response.status_code
+        else:
+            response = self._session.get(full_url)
+            status_code = response.status_code
+        with self._throttle_lock:
+            self._request_times.append(monotonic())
+
+        if status_code != 200:
+            raise CongressHTTPError(
+                f"Bad request; API responded with status code {status_code}",
+                status_code=status_code,
+                response=response,
+            )
         else:
             return response
 
-    def __validate_params(self, params):
-        """Validate get request parameter values
-
-        Args:
-            params (dict): User-specified parameter names and values to be propagated to
-            __send_request()
-
-        Returns:
-            query_params (dict): Validated parameter names and values to be propagated to
-            __send_request()
-        """
-
-        # Initialize request parameters as default parameters
-        query_params = self.__default_query_params
-
-        # Replace request parameters with user-supplied parameters
-        for param in params:
-            if param in query_params:
-                query_params[param] = params[param]
-            else:
-                warn(f"Invalid parameter name '{param}' supplied.\
-                    Will use default name and value instead.")
-        return query_params
-
     def __compose_full_url(self, url_prefix, path):
         """Compose full URL to be propagated to __send_request()
 
@@ -138,12 +347,11 @@ class Congress():
             str: Full path of desired Congress API endpoint (i.e including the root)
         """
 
-        if not path:
-            path = ""
-        full_url = '/'.join([self.__origin_url, url_prefix, path.lower()])
-        return full_url
+        if path:
+            return self._endpoint_urls[url_prefix] + "/" + path.lower()
+        return self._endpoint_urls[url_prefix]
 
-    def __process_request(self, url_prefix, path, throttle, params):
+    def _process_request(self, url_prefix, path, throttle, params, stream=False):
         """Processes requests to the Congress API. First validates the user-specified
         parameters, then composes a full URL of the endpoint, and finally sends the request to
         (and receives the response from) the Congress API.
@@ -153,246 +361,76 @@ class Congress():
             path (str): Path of desired Congress API endpoint, not including the root
             params (dict): User-specified parameter names and values to be propagated to
             __send_request()
+            stream (bool): If True, return a streaming response without buffering the body
 
         Returns:
             response (requests.Response): The response object
         """
 
-        query_params = self.__validate_params(params)
+        query_params = _validate_params(params)
         full_url = self.__compose_full_url(url_prefix, path)
-        response = self.__send_request(full_url, throttle, **query_params)
-        return response
-
-    def bill(self, path=None, throttle=False, **params):
-        """Implements access to all '/bill/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("bill", path, throttle, params)
-        return response.text
-
-    def amendment(self, path=None, throttle=False, **params):
-        """Implements access to all '/amendment/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
 
-        response = self.__process_request("amendment", path, throttle, params)
-        return response.text
+        if stream:
+            # Streamed responses bypass the cache; the caller consumes the body
+            # incrementally and closes the response
+            if self._http2:
+                raise ValueError("stream=True is not supported with the HTTP/2 transport")
+            return self.__send_request(full_url, throttle, stream=True, **query_params)
 
-    def summaries(self, path=None, throttle=False, **params):
-        """Implements access to all '/summaries/...' endpoints of the Congress API
+        key = (url_prefix, path, tuple(sorted(query_params.items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("summaries", path, throttle, params)
-        return response.text
-
-    def congress(self, path=None, throttle=False, **params):
-        """Implements access to all '/congress/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("congress", path, throttle, params)
-        return response.text
-
-    def member(self, path=None, throttle=False, **params):
-        """Implements access to all '/member/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("member", path, throttle, params)
-        return response.text
-
-    def committee(self, path=None, throttle=False, **params):
-        """Implements access to all '/committee/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("committee", path, throttle, params)
-        return response.text
-
-    def committee_report(self, path=None, throttle=False, **params):
-        """Implements access to all '/committee-report/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("committee-report", path, throttle, params)
-        return response.text
-
-    def committee_print(self, path=None, throttle=False, **params):
-        """Implements access to all '/committee-print/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("committee-print", path, throttle, params)
-        return response.text
-
-    def committee_meeting(self, path=None, throttle=False, **params):
-        """Implements access to all '/committee-meeting/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("committee-meeting", path, throttle, params)
-        return response.text
-
-    def hearing(self, path=None, throttle=False, **params):
-        """Implements access to all '/hearing/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("hearing", path, throttle, params)
-        return response.text
-
-    def congressional_record(self, path=None, throttle=False, **params):
-        """Implements access to all '/congressional-record/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("congressional-record", path, throttle, params)
-        return response.text
-
-    def daily_congressional_record(self, path=None, throttle=False, **params):
-        """Implements access to all '/daily-congressional-record/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("daily-congressional-record", path, throttle, params)
-        return response.text
-
-    def bound_congressional_record(self, path=None, throttle=False, **params):
-        """Implements access to all '/bill/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("bound-congressional-record", path, throttle, params)
-        return response.text
-
-    def house_communication(self, path=None, throttle=False, **params):
-        """Implements access to all '/house-communication/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("house-communication", path, throttle, params)
-        return response.text
-
-    def house_requirement(self, path=None, throttle=False, **params):
-        """Implements access to all '/house-requirement/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
+        response = self.__send_request(full_url, throttle, **query_params)
+        with self._cache_lock:
+            self._cache[key] = response
+        return response
 
-        response = self.__process_request("house-requirement", path, throttle, params)
-        return response.text
 
-    def senate_communication(self, path=None, throttle=False, **params):
-        """Implements access to all '/senate-communication/...' endpoints of the Congress API
+def _make_endpoint(py_name, url_prefix):
+    """Build an endpoint method implementing access to one endpoint family.
 
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
+    Args:
+        py_name (str): Method name as exposed on Congress
+        url_prefix (str): Root of the desired Congress API endpoint family
 
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
-
-        response = self.__process_request("senate-communication", path, throttle, params)
-        return response.text
+    Returns:
+        function: Method implementing the endpoint
+    """
 
-    def nomination(self, path=None, throttle=False, **params):
-        """Implements access to all '/nomination/...' endpoints of the Congress API
+    def endpoint(self, path=None, throttle=False, stream=False, parse=False, **params):
+        response = self._process_request(url_prefix, path, throttle, params, stream=stream)
+        if stream:
+            return response
+        # urllib3 responses expose the body as .data, requests/httpx as .content
+        body = response.data if self._pool is not None else response.content
+        if parse:
+            # Parse straight from the response bytes, skipping the str decode
+            return _loads(body)
+        return body.decode("utf-8")
+
+    endpoint.__name__ = py_name
+    endpoint.__qualname__ = f"Congress.{py_name}"
+    endpoint.__doc__ = f"""Implements access to all '/{url_prefix}/...' endpoints \
+of the Congress API
 
         Args:
             path (str, optional): Endpoint URL, not including the root. Defaults to None.
+            stream (bool, optional): If True, return the streaming response object
+            without buffering the body: a requests.Response (iterate with iter_content,
+            then close) on the default transport, or a urllib3.HTTPResponse (iterate
+            with stream(), then release_conn) in fast mode. Defaults to False.
+            parse (bool, optional): If True, return the response body decoded from JSON
+            instead of the raw text. Ignored when stream=True. Defaults to False.
 
         Returns:
-            str (requests.Response.text): Contents of response text
+            str (requests.Response.text): Contents of response text; the decoded JSON
+            object when parse=True, or the Response object when stream=True
         """
+    return endpoint
 
-        response = self.__process_request("nomination", path, throttle, params)
-        return response.text
-
-    def treaty(self, path=None, throttle=False, **params):
-        """Implements access to all '/treaty/...' endpoints of the Congress API
-
-        Args:
-            path (str, optional): Endpoint URL, not including the root. Defaults to None.
-
-        Returns:
-            str (requests.Response.text): Contents of response text
-        """
 
-        response = self.__process_request("treaty", path, throttle, params)
-        return response.text
+for _py_name, _url_prefix in _ENDPOINTS.items():
+    setattr(Congress, _py_name, _make_endpoint(_py_name, _url_prefix))